@@ -1,5 +1,6 @@
 from __future__ import annotations
 import re, webbrowser
+from html import escape
 import gradio as gr
 
 from name_core import (
@@ -7,6 +8,9 @@ from name_core import (
     name_to_strokes, fortune_from_last_digit
 )
 from name_svg import build_viz
+from name_card import heart_svg, result_card_html
+from name_group import GROUP_MAX, pair_scores, rank_group
+from name_table import default_table
 
 # ---------- utils ---------- #
 def _make_steps_and_labels(name1: str, name2: str):
@@ -20,6 +24,32 @@ def _make_steps_and_labels(name1: str, name2: str):
     labels = list(hangul_syllables(full))[: len(steps[0])]
     return steps, labels, None, None
 
+def _make_group_view(text: str):
+    """쉼표로 나눈 K명 → (순위 HTML, 최고 점수 문자열, 오류)."""
+    names = [n.strip() for n in text.split(",") if n.strip()]
+    if len(names) < 3:
+        return None, None, "⚠️ 그룹 모드는 3명 이상 입력하세요."
+    if len(names) > GROUP_MAX:
+        return None, None, f"⚠️ 그룹 모드는 최대 {GROUP_MAX}명까지 가능합니다."
+    try:
+        orders = rank_group(names, top=5)
+        pairs = pair_scores(names)[:5]
+    except ValueError as e:
+        return None, None, f"⚠️ {escape(str(e))}"
+    order_rows = "".join(
+        f"<li><b>{score:02d}%</b> · {' → '.join(escape(n) for n in order)}</li>" for score, order in orders
+    )
+    pair_rows = "".join(
+        f"<li><b>{score:02d}%</b> · {escape(a)} ♥ {escape(b)}</li>" for score, a, b in pairs
+    )
+    html = f"""
+    <div class="group-wrap">
+      <div class="group-title">👥 팀 케미 순위 ({len(names)}명)</div>
+      <div class="group-sub">전체 순서 TOP {len(orders)}</div><ol>{order_rows}</ol>
+      <div class="group-sub">두 사람 조합 TOP {len(pairs)}</div><ol>{pair_rows}</ol>
+    </div>"""
+    return html, f"{orders[0][0]:02d}", None
+
 def _final_number(steps: list[list[int]]) -> list[str]:
     if not steps: return []
     return [str(x) for x in steps[-1]]
@@ -139,12 +169,21 @@ GLOBAL_CSS = """
     width:92%;
   }
 
+  /* ====== 그룹 모드 순위 ====== */
+  .group-wrap { height:100%; overflow:auto; color:#9d174d; padding:4px 8px; }
+  .group-title { font-weight:900; font-size:20px; color:#be185d; text-align:center; margin-bottom:8px; }
+  .group-sub { font-weight:800; color:#be185d; margin-top:10px; }
+  .group-wrap ol { margin:6px 0 0 18px; line-height:1.6; }
+
   .nav-bar { display:flex; gap:10px; justify-content:center; margin-top:12px; }
 </style>
 """
 
 # ---------- UI ---------- #
 def launch():
+    # 짧은 이름 점수표 mmap (그룹 모드 순서쌍 점수용; 두 사람 화면은 애니메이션에
+    # 축약 단계가 모두 필요해 expand_reduction_steps로 계산)
+    default_table()
     with gr.Blocks(title="이름 궁합 • Wizard", fill_height=False) as demo:
         gr.HTML(GLOBAL_CSS)
         with gr.Column(elem_classes=["wizard-frame"]):
@@ -162,6 +201,8 @@ def launch():
                     with step1:
                         name1 = gr.Textbox(label="이름 1", placeholder="예: 김철수")
                         name2 = gr.Textbox(label="이름 2", placeholder="예: 김영희")
+                        group = gr.Textbox(label=f"그룹 모드 (선택, 3~{GROUP_MAX}명 쉼표 구분)",
+                                           placeholder="예: 김철수, 김영희, 박민준")
                         speed = gr.Slider(1, 5, step=1, value=3, label="애니메이션 속도")
                         gr.Markdown("**규칙:** 두 이름을 번갈아 쓰고, 획수를 합산해 1의 자리만 남겨 최종 2자리까지 계산합니다.", elem_classes=["pink-help"])
 
@@ -182,7 +223,29 @@ def launch():
                     btn_reset = gr.Button("처음으로", elem_classes=["pink-btn"], visible=False)
 
         # ---------- 전환 ---------- #
-        def on_next(cur_step, n1, n2, spd, v_html, f_svg, last_d):
+        def on_next(cur_step, n1, n2, grp, spd, v_html, f_svg, last_d):
+            # 1 -> 2 (그룹 모드: 애니메이션 대신 순위표)
+            if cur_step == 1 and grp.strip():
+                group_html, num_str, err = _make_group_view(grp)
+                if err:
+                    return (
+                        1,
+                        gr.update(visible=True), gr.update(visible=False), gr.update(visible=False),
+                        gr.update(value=f"<div style='padding:12px;color:#a00;font-weight:700;'>{err}</div>"),
+                        v_html, f_svg, last_d,
+                        gr.update(value=""), gr.update(value=""),
+                        gr.update(visible=False), gr.update(visible=True), gr.update(visible=False)
+                    )
+                final_svg = heart_svg(num_str)
+                return (
+                    2,
+                    gr.update(visible=False), gr.update(visible=True), gr.update(visible=False),
+                    gr.update(value=group_html),
+                    group_html, final_svg, int(num_str[-1]) % 10,
+                    gr.update(value=""), gr.update(value=""),
+                    gr.update(visible=True), gr.update(visible=True), gr.update(visible=False)
+                )
+
             # 1 -> 2
             if cur_step == 1:
                 made = _make_steps_and_labels(n1, n2)
@@ -212,18 +275,7 @@ def launch():
                 finals = _final_number(steps)
                 if len(finals) == 2:
                     num_str = finals[0] + finals[1]
-                    final_svg = f"""
-                    <div class='final-heart'>
-                      <svg viewBox="0 0 200 180" xmlns="http://www.w3.org/2000/svg">
-                        <defs><linearGradient id="gradHeart" x1="0" y1="0" x2="1" y2="1">
-                          <stop offset="0%" stop-color="#fff0f6"/><stop offset="100%" stop-color="#fda4af"/></linearGradient></defs>
-                        <path d="M100 170 C 20 110, 20 40, 60 40 C 80 40, 100 60, 100 80
-                                 C 100 60, 120 40, 140 40 C 180 40, 180 110, 100 170 Z"
-                              fill="url(#gradHeart)" stroke="#f43f5e" stroke-width="3"/>
-                        <text x="100" y="105" text-anchor="middle" dominant-baseline="middle"
-                              font-size="56" font-weight="900" fill="#be185d">{num_str}</text>
-                      </svg>
-                    </div>"""
+                    final_svg = heart_svg(num_str)
                     last_digit = int(num_str[-1]) % 10
                 else:
                     final_svg, last_digit = "", 0
@@ -243,14 +295,7 @@ def launch():
                 score_str = m[0] if m else "--"
                 grade, text = fortune_from_last_digit(int(last_d))
 
-                combined = f"""
-                <div class="result-wrap">
-                  <div class="result-card">
-                    {f_svg}
-                    <div class="score-chip">점수 {score_str} · 등급 {grade}</div>
-                    <div class="desc-box">{text}</div>
-                  </div>
-                </div>"""
+                combined = result_card_html(f_svg, score_str, grade, text)
 
                 return (
                     3,
@@ -312,7 +357,7 @@ def launch():
         # 이벤트
         btn_next.click(
             on_next,
-            inputs=[step_idx, name1, name2, speed, viz_html_state, final_svg_state, last_digit_state],
+            inputs=[step_idx, name1, name2, group, speed, viz_html_state, final_svg_state, last_digit_state],
             outputs=[step_idx, step1, step2, step3, calc_view, viz_html_state, final_svg_state, last_digit_state,
                      final_heart, fortune_text, btn_prev, btn_next, btn_reset]
         )
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+from html import escape
+
+__all__ = [
+    "heart_svg",
+    "result_card_html",
+    "card_svg",
+]
+
+HEART_PATH = ("M100 170 C 20 110, 20 40, 60 40 C 80 40, 100 60, 100 80 "
+              "C 100 60, 120 40, 140 40 C 180 40, 180 110, 100 170 Z")
+
+def heart_svg(num_str: str) -> str:
+    """최종 두 자리 하트 (결과 화면용 HTML 조각)."""
+    return f"""
+                    <div class='final-heart'>
+                      <svg viewBox="0 0 200 180" xmlns="http://www.w3.org/2000/svg">
+                        <defs><linearGradient id="gradHeart" x1="0" y1="0" x2="1" y2="1">
+                          <stop offset="0%" stop-color="#fff0f6"/><stop offset="100%" stop-color="#fda4af"/></linearGradient></defs>
+                        <path d="{HEART_PATH}"
+                              fill="url(#gradHeart)" stroke="#f43f5e" stroke-width="3"/>
+                        <text x="100" y="105" text-anchor="middle" dominant-baseline="middle"
+                              font-size="56" font-weight="900" fill="#be185d">{num_str}</text>
+                      </svg>
+                    </div>"""
+
+def result_card_html(heart: str, score_str: str, grade: str, text: str) -> str:
+    """3단계 결과 카드 (GLOBAL_CSS의 .result-card 스타일 사용)."""
+    return f"""
+                <div class="result-wrap">
+                  <div class="result-card">
+                    {heart}
+                    <div class="score-chip">점수 {score_str} · 등급 {grade}</div>
+                    <div class="desc-box">{text}</div>
+                  </div>
+                </div>"""
+
+def card_svg(score_str: str, grade: str, text: str, width: int = 600, height: int = 440) -> str:
+    """결과 카드를 애니메이션/외부 CSS 없는 단독 SVG 문서로 (공유 이미지 내보내기용)."""
+    cx = width / 2
+    return f"""<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">
+  <defs>
+    <linearGradient id="gradHeart" x1="0" y1="0" x2="1" y2="1">
+      <stop offset="0%" stop-color="#fff0f6"/><stop offset="100%" stop-color="#fda4af"/>
+    </linearGradient>
+  </defs>
+  <rect x="8" y="8" width="{width-16}" height="{height-16}" rx="16" ry="16"
+        fill="#fffafb" stroke="#fecdd3" stroke-width="2"/>
+  <g transform="translate({cx-100:.1f} 24)">
+    <path d="{HEART_PATH}" fill="url(#gradHeart)" stroke="#f43f5e" stroke-width="3"/>
+    <text x="100" y="105" text-anchor="middle" dominant-baseline="middle"
+          font-size="56" font-weight="900" fill="#be185d">{escape(score_str)}</text>
+  </g>
+  <text x="{cx:.1f}" y="240" text-anchor="middle" font-size="18" font-weight="900" fill="#be185d"
+        font-family="Pretendard, Noto Sans KR, sans-serif">점수 {escape(score_str)} · 등급 {escape(grade)}</text>
+  <rect x="{width*0.04+8:.1f}" y="266" width="{width*0.92-16:.1f}" height="{height-300}" rx="12" ry="12"
+        fill="#fff0f6" stroke="#fda4af" stroke-width="2"/>
+  <text x="{cx:.1f}" y="{266+(height-300)/2:.1f}" text-anchor="middle" dominant-baseline="middle"
+        font-size="16" fill="#9d174d" font-family="Pretendard, Noto Sans KR, sans-serif">{escape(text)}</text>
+</svg>
+"""
@@ -9,6 +9,9 @@ __all__ = [
     "fortune_from_last_digit",
     "syllable_stroke_count",
     "interleave_names",
+    "interleave_rows",
+    "reduction_coefficients",
+    "final_digits",
 ]
 
 # ---------------- Korean decomposition ----------------
@@ -82,6 +85,13 @@ def interleave_names(name1: str, name2: str) -> str:
         result.extend(syls2[len(syls1):])
     return "".join(result)
 
+def interleave_rows(rows: List[List[int]]) -> List[int]:
+    """여러 이름의 획수 행을 한 칸씩 돌아가며 합침 (interleave_names와 같은 순서)."""
+    result: List[int] = []
+    for j in range(max((len(r) for r in rows), default=0)):
+        result.extend(r[j] for r in rows if j < len(r))
+    return result
+
 def expand_reduction_steps(seq: List[int]) -> List[List[int]]:
     """인접 합을 1의 자리로 줄여 길이 2가 될 때까지 반복."""
     if not seq or len(seq) < 2:
@@ -93,6 +103,24 @@ def expand_reduction_steps(seq: List[int]) -> List[List[int]]:
         steps.append(cur)
     return steps
 
+@lru_cache(maxsize=128)
+def reduction_coefficients(n: int) -> Tuple[int, ...]:
+    """길이 n 행을 2자리까지 줄일 때 각 칸에 곱해지는 계수 C(n-2, i) mod 10."""
+    row = [1]
+    for _ in range(max(0, n - 2)):
+        row = [(a + b) % 10 for a, b in zip([0] + row, row + [0])]
+    return tuple(row)
+
+def final_digits(seq: List[int]) -> List[int]:
+    """expand_reduction_steps(seq)[-1]과 같은 값을 축약 루프 없이 계산.
+    인접 합 mod 10은 선형이라 최종 두 자리는 이항계수 가중합과 같다."""
+    if len(seq) <= 2:
+        return list(seq)
+    coeffs = reduction_coefficients(len(seq))
+    left = sum(c * v for c, v in zip(coeffs, seq) if c) % 10
+    right = sum(c * v for c, v in zip(coeffs, seq[1:]) if c) % 10
+    return [left, right]
+
 # ---------------- Fortune ----------------
 def fortune_from_last_digit(d: int) -> Tuple[str, str]:
     """마지막 1자리 숫자 해석 (재미용)."""
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""결과 카드 일괄 내보내기 (정적 SVG).
+
+    python name_export.py pairs.csv -o cards/            # 디렉터리
+    python name_export.py pairs.csv -o cards.zip --viz   # zip (축약 다이어그램 포함)
+    python name_export.py pairs.csv -o - > cards.tar     # tar 스트림(stdout)
+
+입력은 한 줄에 `이름1,이름2`. 파일명은 내용 해시라 같은 카드는 한 번만 쓰이고,
+어떤 쌍이 어떤 파일인지는 manifest.csv에 남는다.
+"""
+from __future__ import annotations
+import argparse, csv, hashlib, io, os, sys, tarfile, tempfile, zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from name_core import (
+    interleave_names, expand_reduction_steps, hangul_syllables,
+    name_to_strokes, fortune_from_last_digit
+)
+from name_card import card_svg
+from name_svg import build_viz
+from name_table import pair_score
+
+__all__ = [
+    "render_pair",
+    "export_cards",
+]
+
+# ---------------- Rendering (worker) ----------------
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+def render_pair(pair: Tuple[str, str], viz: bool = False) -> List[Tuple[str, str, bytes]]:
+    """이름 쌍 → [(종류, 해시, SVG 바이트)]. 한글 2음절 미만이면 빈 목록."""
+    name1, name2 = pair
+    score = pair_score(name1, name2)
+    if score is None:
+        return []
+    num_str = f"{score:02d}"
+    grade, text = fortune_from_last_digit(score % 10)
+
+    out = []
+    card = card_svg(num_str, grade, text).encode("utf-8")
+    out.append(("card", _digest(card), card))
+    if viz:
+        full = interleave_names(name1, name2)
+        steps = expand_reduction_steps([s % 10 for s in name_to_strokes(full)])
+        labels = hangul_syllables(full)[: len(steps[0])]
+        svg, _, _ = build_viz(steps, labels=labels, target_w=720, target_h=456, static=True)
+        data = svg.encode("utf-8")
+        out.append(("viz", _digest(data), data))
+    return out
+
+def _render_task(pair: Tuple[str, str], viz: bool):
+    return pair, render_pair(pair, viz)
+
+# ---------------- Sinks ----------------
+class _DirSink:
+    def __init__(self, path: str):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+
+    def add(self, name: str, data: bytes):
+        with open(os.path.join(self.path, name), "wb") as f:
+            f.write(data)
+
+    def close(self):
+        pass
+
+class _TarSink:
+    def __init__(self, fileobj):
+        self.tar = tarfile.open(fileobj=fileobj, mode="w|")
+
+    def add(self, name: str, data: bytes):
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        self.tar.addfile(info, io.BytesIO(data))
+
+    def close(self):
+        self.tar.close()
+
+class _ZipSink:
+    def __init__(self, fileobj):
+        self.zip = zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED)
+
+    def add(self, name: str, data: bytes):
+        self.zip.writestr(name, data)
+
+    def close(self):
+        self.zip.close()
+
+def _guess_format(out: str) -> str:
+    if out == "-":
+        return "tar"
+    if os.path.isdir(out) or out.endswith((os.sep, "/")):
+        return "dir"
+    return os.path.splitext(out)[1].lstrip(".").lower() or "dir"
+
+def _resolve_format(out: str, fmt: Optional[str]) -> str:
+    """출력 경로와 형식이 맞는지 확인하고 형식을 돌려준다. 안 맞으면 ValueError."""
+    fmt = fmt or _guess_format(out)
+    if fmt not in ("dir", "tar", "zip"):
+        raise ValueError(f"지원하지 않는 출력 형식: {fmt} (디렉터리, .tar, .zip 또는 '-')")
+    if fmt == "dir" and out == "-":
+        raise ValueError("stdout('-')에는 디렉터리로 내보낼 수 없습니다 (tar/zip 사용)")
+    if fmt != "dir" and out != "-" and os.path.isdir(out):
+        raise ValueError(f"{fmt} 출력 경로가 디렉터리입니다: {out}")
+    return fmt
+
+def _open_sink(out: str, fmt: Optional[str]):
+    """형식을 먼저 확인하고, tar/zip일 때만 출력 파일을 연다."""
+    fmt = _resolve_format(out, fmt)
+    if fmt == "dir":
+        return _DirSink(out), None
+    fileobj = sys.stdout.buffer if out == "-" else open(out, "wb")
+    try:
+        sink = _TarSink(fileobj) if fmt == "tar" else _ZipSink(fileobj)
+    except Exception:
+        if fileobj is not sys.stdout.buffer:
+            fileobj.close()
+        raise
+    return sink, fileobj
+
+# ---------------- Export ----------------
+def _bounded_map(pairs: Iterable[Tuple[str, str]], viz: bool, workers: int) -> Iterator:
+    """입력 순서대로 결과를 내되, 동시에 떠 있는 작업은 workers*4개로 제한."""
+    if workers <= 1:
+        for pair in pairs:
+            yield _render_task(pair, viz)
+        return
+    window = workers * 4
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        pending = deque()
+        for pair in pairs:
+            pending.append(ex.submit(_render_task, pair, viz))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def export_cards(
+    pairs: Iterable[Tuple[str, str]],
+    out: str,
+    viz: bool = False,
+    fmt: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> Tuple[int, int]:
+    """pairs를 렌더링해 out(디렉터리 / .tar / .zip / '-')에 쓴다.
+    반환: (처리한 쌍 수, 실제로 쓴 파일 수)."""
+    sink, fileobj = _open_sink(out, fmt)
+    seen = set()
+    n_pairs = n_files = 0
+    with tempfile.TemporaryFile("w+", encoding="utf-8", newline="") as manifest:
+        writer = csv.writer(manifest)
+        writer.writerow(["name1", "name2", "card", "viz"])
+        try:
+            for (name1, name2), files in _bounded_map(pairs, viz, workers or os.cpu_count() or 1):
+                n_pairs += 1
+                row = {"card": "", "viz": ""}
+                for kind, digest, data in files:
+                    fname = f"{kind}-{digest}.svg"
+                    row[kind] = fname
+                    if digest not in seen:
+                        seen.add(digest)
+                        sink.add(fname, data)
+                        n_files += 1
+                writer.writerow([name1, name2, row["card"], row["viz"]])
+            manifest.seek(0)
+            sink.add("manifest.csv", manifest.read().encode("utf-8"))
+        finally:
+            sink.close()
+            if fileobj is not None and fileobj is not sys.stdout.buffer:
+                fileobj.close()
+    return n_pairs, n_files
+
+def _read_pairs(f) -> Iterator[Tuple[str, str]]:
+    for row in csv.reader(f):
+        if len(row) >= 2 and row[0].strip() and row[1].strip():
+            yield row[0].strip(), row[1].strip()
+
+def main(argv: Optional[List[str]] = None):
+    ap = argparse.ArgumentParser(description="이름 궁합 결과 카드 일괄 내보내기 (정적 SVG)")
+    ap.add_argument("pairs", help="`이름1,이름2` 줄 단위 CSV ('-'이면 stdin)")
+    ap.add_argument("-o", "--out", required=True, help="출력 디렉터리, .tar/.zip 파일, 또는 '-'(stdout)")
+    ap.add_argument("--format", choices=["dir", "tar", "zip"], help="출력 형식 (기본: 확장자로 추정)")
+    ap.add_argument("--viz", action="store_true", help="축약 다이어그램 SVG도 함께 내보내기")
+    ap.add_argument("-j", "--workers", type=int, help="프로세스 수 (기본: CPU 수)")
+    args = ap.parse_args(argv)
+    try:
+        _resolve_format(args.out, args.format)
+    except ValueError as e:
+        ap.error(str(e))
+
+    f = sys.stdin if args.pairs == "-" else open(args.pairs, encoding="utf-8", newline="")
+    try:
+        n_pairs, n_files = export_cards(_read_pairs(f), args.out, viz=args.viz,
+                                        fmt=args.format, workers=args.workers)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+    print(f"{n_pairs}쌍 처리, 파일 {n_files}개 작성", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
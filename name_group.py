@@ -0,0 +1,117 @@
+from __future__ import annotations
+import heapq
+from typing import List, Optional, Sequence, Tuple
+
+from name_core import name_to_strokes, reduction_coefficients
+from name_table import score_rows
+
+__all__ = [
+    "GROUP_MAX",
+    "pair_scores",
+    "rank_group",
+]
+
+GROUP_MAX = 8    # 위저드에서 받는 최대 인원
+MAX_SCORE = 99
+
+# ---------------- Stroke rows ----------------
+def _digit_rows(names: Sequence[str]) -> List[Tuple[int, ...]]:
+    rows = [tuple(s % 10 for s in name_to_strokes(n)) for n in names]
+    if len(rows) < 2:
+        raise ValueError("최소 두 사람 이름이 필요합니다.")
+    for n, r in zip(names, rows):
+        if not r:
+            raise ValueError(f"한글 음절이 없는 이름입니다: {n!r}")
+    return rows
+
+def pair_scores(names: Sequence[str]) -> List[Tuple[int, str, str]]:
+    """모든 순서쌍 (a, b)의 점수(0~99)를 높은 순으로."""
+    rows = _digit_rows(names)
+    out = []
+    for a, ra in enumerate(rows):
+        for b, rb in enumerate(rows):
+            if a != b:
+                out.append((score_rows(ra, rb), names[a], names[b]))
+    out.sort(key=lambda t: -t[0])
+    return out
+
+# ---------------- Group orderings ----------------
+def _contributions(rows: Sequence[Tuple[int, ...]]) -> List[List[Optional[Tuple[int, int]]]]:
+    """contrib[i][mask] = 이름 i가 mask 집합 바로 뒤 순번에 올 때 최종 두 자리에 더하는 값.
+
+    j번째 라운드의 시작 위치는 순서와 무관하고(모든 이름의 min(len, j) 합),
+    라운드 안의 오프셋은 앞에 온 이름 중 j번째 음절이 있는 수뿐이다.
+    그래서 기여도는 '앞에 온 집합'에만 의존하고 K * 2^K 표로 공유된다."""
+    k = len(rows)
+    lens = [len(r) for r in rows]
+    n = sum(lens)
+    coeffs = reduction_coefficients(n)
+    base = [sum(min(ln, j) for ln in lens) for j in range(max(lens))]
+    contrib: List[List[Optional[Tuple[int, int]]]] = [[None] * (1 << k) for _ in range(k)]
+    for mask in range(1 << k):
+        before = [t for t in range(k) if mask >> t & 1]
+        for i in range(k):
+            if mask >> i & 1:
+                continue
+            left = right = 0
+            for j, v in enumerate(rows[i]):
+                p = base[j] + sum(1 for t in before if lens[t] > j)
+                if p < n - 1:
+                    left += coeffs[p] * v
+                if p >= 1:
+                    right += coeffs[p - 1] * v
+            contrib[i][mask] = (left % 10, right % 10)
+    return contrib
+
+def _walk(contrib, prev_same, k, top):
+    """모든 순서를 인덱스 사전순으로 훑어 (점수, 인덱스 순서) 목록을 반환.
+
+    사전순으로 훑으므로 99점 순서가 top개 모이면 그 뒤는 순위에 들 수 없어 멈춘다."""
+    out: List[Tuple[int, Tuple[int, ...]]] = []
+    best = 0  # 찾은 99점 순서 수
+    order: List[int] = []
+
+    def rec(mask, left, right):
+        nonlocal best
+        if len(order) == k:
+            score = (left % 10) * 10 + right % 10
+            out.append((score, tuple(order)))
+            best += score == MAX_SCORE
+            return top is not None and best >= top
+        for i in range(k):
+            if mask >> i & 1:
+                continue
+            p = prev_same[i]
+            if p >= 0 and not mask >> p & 1:
+                continue  # 같은 이름은 인덱스 순으로만 배치 (중복 순서 가지치기)
+            dl, dr = contrib[i][mask]
+            order.append(i)
+            stop = rec(mask | 1 << i, left + dl, right + dr)
+            order.pop()
+            if stop:
+                return True
+        return False
+
+    rec(0, 0, 0)
+    return out
+
+def rank_group(
+    names: Sequence[str],
+    top: Optional[int] = None,
+) -> List[Tuple[int, Tuple[str, ...]]]:
+    """K명을 한 음절씩 돌아가며 섞는 모든 순서의 점수(0~99)를 높은 순으로.
+
+    똑같은 이름이 여러 번 있으면 그 둘의 자리만 바뀐 순서는 한 번만 나온다.
+    top을 주면 99점 순서가 top개 모이는 즉시 탐색을 멈춘다(결과는 같음)."""
+    names = list(names)
+    rows = _digit_rows(names)
+    k = len(rows)
+    contrib = _contributions(rows)
+    prev_same = [max((j for j in range(i) if names[j] == names[i]), default=-1) for i in range(k)]
+
+    found = _walk(contrib, prev_same, k, top)
+    if top is not None:
+        found = heapq.nsmallest(top, found, key=lambda t: (-t[0], t[1]))
+    else:
+        found.sort(key=lambda t: (-t[0], t[1]))
+    return [(score, tuple(names[i] for i in order)) for score, order in found]
@@ -11,7 +11,10 @@ def build_viz(
     target_w: int = 800,
     target_h: int = 360,
     tall_mode: bool = False,
+    static: bool = False,
 ):
+    """축약 과정 SVG. static=True면 애니메이션 없이 완성된 그림을
+    스타일을 내장한 단독 <svg> 문서로 반환(파일 내보내기용)."""
     params, positions, svg_w, svg_h = compute_layout(
         steps, target_w=target_w, target_h=target_h, tall_mode=tall_mode
     )
@@ -30,6 +33,8 @@ def build_viz(
     row_span_ms = int((dur_draw + dur_drop + pause) * 1000)
     row_delay   = lambda r: (dur_draw + dur_drop + pause) * r
     d_line      = lambda ax,ay,bx,by: f"M {ax:.1f} {ay:.1f} L {bx:.1f} {by:.1f}"
+    anim        = (lambda s: "") if static else (lambda s: f' style="{s}"')
+    line_anim   = "" if static else f"stroke-dasharray:1; stroke-dashoffset:1; animation: draw {dur_draw:.2f}s ease both;"
 
     # 폰트/두께
     num_font   = max(24, int(cell_h * 0.42))
@@ -67,7 +72,7 @@ def build_viz(
       .label {{ font-weight:800; font-size:{label_font}px; fill:#be185d;
                text-anchor:middle; dominant-baseline:hanging; }}
       .line {{ stroke-width:{line_w:.2f}; fill:none; stroke-linecap:round; stroke-linejoin:round;
-               stroke-dasharray:1; stroke-dashoffset:1; animation: draw {dur_draw:.2f}s ease both; }}
+               {line_anim} }}
       @keyframes draw {{ to {{ stroke-dashoffset:0; }} }}
       @keyframes drop {{ from {{ transform: translateY(-18px); opacity:0; }} to {{ transform:none; opacity:1; }} }}
       @keyframes fadeout {{ to {{ opacity:0; }} }}
@@ -101,7 +106,7 @@ def build_viz(
             label_svg = f'<text class="label" x="{lx:.1f}" y="{ly:.1f}">{labels[i]}</text>'
         nodes.append(f"""
         {label_svg}
-        <g style="animation:drop {dur_drop:.2f}s ease both; animation-delay:{row_delay(0):.2f}s">
+        <g{anim(f"animation:drop {dur_drop:.2f}s ease both; animation-delay:{row_delay(0):.2f}s")}>
           <rect class="box" x="{x+pad_x:.1f}" y="{y+pad_y:.1f}" width="{cell_w:.1f}" height="{cell_h:.1f}"/>
           <rect class="bar" x="{x+pad_x+(cell_w-bar_w)/2:.1f}" y="{y+pad_y+cell_h-12:.1f}" width="{bar_w:.1f}" height="9"/>
           <text class="num" x="{x+pad_x+cell_w/2:.1f}" y="{y+pad_y+cell_h/2-5:.1f}">{v}</text>
@@ -113,7 +118,7 @@ def build_viz(
     gid = 0
     for r in range(1, rows):
         delay = row_delay(r)
-        group = [f'<g style="animation: fadeout {pause:.2f}s linear both {delay+dur_draw+dur_drop:.2f}s">']
+        group = [f'<g{anim(f"animation: fadeout {pause:.2f}s linear both {delay+dur_draw+dur_drop:.2f}s")}>']
         for i, _ in enumerate(steps[r]):
             p1x,p1y = positions[r-1][i]
             p2x,p2y = positions[r-1][i+1]
@@ -135,8 +140,8 @@ def build_viz(
                 f'x1="{a2x:.1f}" y1="{a2y:.1f}" x2="{bx_r:.1f}" y2="{by_t:.1f}">'
                 f'<stop offset="0%" stop-color="#fbcfe8"/><stop offset="100%" stop-color="#ec4899"/></linearGradient>'
             )
-            group.append(f'<path class="line" style="animation-delay:{delay:.2f}s" d="{d_line(a1x,a1y,bx_l,by_t)}" stroke="url(#{g1})" pathLength="1"/>')
-            group.append(f'<path class="line" style="animation-delay:{delay:.2f}s" d="{d_line(a2x,a2y,bx_r,by_t)}" stroke="url(#{g2})" pathLength="1"/>')
+            group.append(f'<path class="line"{anim(f"animation-delay:{delay:.2f}s")} d="{d_line(a1x,a1y,bx_l,by_t)}" stroke="url(#{g1})" pathLength="1"/>')
+            group.append(f'<path class="line"{anim(f"animation-delay:{delay:.2f}s")} d="{d_line(a2x,a2y,bx_r,by_t)}" stroke="url(#{g2})" pathLength="1"/>')
         group.append('</g>')
         lines_layers.append("".join(group))
 
@@ -144,16 +149,14 @@ def build_viz(
             cx, cy = positions[r][i]
             bar_w = max(6, (v/9.0)*(cell_w*0.78))
             nodes.append(f"""
-            <g style="animation:drop {dur_drop:.2f}s ease both; animation-delay:{(delay+dur_draw):.2f}s">
+            <g{anim(f"animation:drop {dur_drop:.2f}s ease both; animation-delay:{(delay+dur_draw):.2f}s")}>
               <rect class="box" x="{cx+pad_x:.1f}" y="{cy+pad_y:.1f}" width="{cell_w:.1f}" height="{cell_h:.1f}"/>
               <rect class="bar" x="{cx+pad_x+(cell_w-bar_w)/2:.1f}" y="{cy+pad_y+cell_h-12:.1f}" width="{bar_w:.1f}" height="9"/>
               <text class="num" x="{cx+pad_x+cell_w/2:.1f}" y="{cy+pad_y+cell_h/2-5:.1f}">{v}</text>
             </g>""")
 
-    html = f"""
-    {css}
-    <div class="viz-wrap">
-      <svg viewBox="0 0 {svg_w:.1f} {max(svg_h, panel_h):.1f}" preserveAspectRatio="xMidYMid meet">
+    view_h = max(svg_h, panel_h)
+    svg_body = f"""
         <defs>
           {defs_blocks}
           {''.join(defs_lines)}
@@ -164,7 +167,15 @@ def build_viz(
           {''.join(lines_layers)}
           {''.join(nodes)}
         </g>
-      </svg>
+    """
+    if static:
+        html = (f'<svg xmlns="http://www.w3.org/2000/svg" width="{svg_w:.0f}" height="{view_h:.0f}" '
+                f'viewBox="0 0 {svg_w:.1f} {view_h:.1f}">{css}{svg_body}</svg>')
+    else:
+        html = f"""
+    {css}
+    <div class="viz-wrap">
+      <svg viewBox="0 0 {svg_w:.1f} {view_h:.1f}" preserveAspectRatio="xMidYMid meet">{svg_body}</svg>
     </div>
     """
     centers = row_centers_from_positions(positions, cell_h, pad_y)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""짧은 이름용 사전 계산 점수표.
+
+축약(인접 합 mod 10)은 선형이라, 두 이름을 섞은 행의 최종 두 자리는
+'이름1 기여 + 이름2 기여'로 나뉜다. 각 기여는 (자기 자리, 상대 길이, 자기 획수 자리)에만
+의존하므로 이름별로 한 번씩, 총 두 번 표를 찾으면 점수가 나온다.
+
+    python name_table.py            # name_table.bin 생성
+    python name_table.py --max-len 5
+
+표에 없는 길이는 기존 축약 루프(expand_reduction_steps)로 계산한다.
+"""
+from __future__ import annotations
+import argparse, mmap, os, struct
+from functools import lru_cache
+from itertools import product
+from typing import List, Optional, Sequence
+
+from name_core import interleave_rows, name_to_strokes, expand_reduction_steps
+
+__all__ = [
+    "TABLE_PATH",
+    "ScoreTable",
+    "build_table",
+    "load_table",
+    "default_table",
+    "score_rows",
+    "pair_score",
+]
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "name_table.bin")
+MAGIC = b"NDT1"
+HEADER = struct.Struct("<4sBB")  # magic, min_len, max_len
+
+# ---------------- Layout ----------------
+def _block_offsets(min_len: int, max_len: int) -> dict:
+    """(자리 0/1, 자기 길이, 상대 길이) → 블록 시작 위치. 블록 안은 획수 자리를 10진수로 본 인덱스."""
+    offsets, pos = {}, HEADER.size
+    for side in (0, 1):
+        for own in range(min_len, max_len + 1):
+            for other in range(min_len, max_len + 1):
+                offsets[(side, own, other)] = pos
+                pos += 10 ** own
+    return offsets
+
+def _encode(digits: Sequence[int]) -> int:
+    return digits[0] * 10 + digits[1]
+
+# ---------------- Build ----------------
+def build_table(path: str = TABLE_PATH, min_len: int = 2, max_len: int = 4) -> str:
+    """모든 획수 자리 조합의 기여를 expand_reduction_steps로 계산해 저장.
+    상대 자리를 0으로 채운 행을 축약하면 그 이름만의 기여가 남는다."""
+    if not 1 <= min_len <= max_len <= 255:
+        raise ValueError(f"음절 수 범위가 잘못되었습니다: {min_len}~{max_len} (1 <= min <= max <= 255)")
+    offsets = _block_offsets(min_len, max_len)
+    size = max(off + 10 ** own for (_, own, _), off in offsets.items())
+    buf = bytearray(size)
+    HEADER.pack_into(buf, 0, MAGIC, min_len, max_len)
+    for (side, own, other), off in offsets.items():
+        zeros = [0] * other
+        for i, digits in enumerate(product(range(10), repeat=own)):
+            row = interleave_rows([digits, zeros] if side == 0 else [zeros, digits])
+            buf[off + i] = _encode(expand_reduction_steps(row)[-1])
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(buf)
+    os.replace(tmp, path)
+    return path
+
+# ---------------- Lookup ----------------
+class ScoreTable:
+    """mmap으로 연 점수표. lookup은 표 범위 밖이면 None."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._mm) < HEADER.size:
+                raise ValueError(f"잘못된 점수표 파일: {path}")
+            magic, self.min_len, self.max_len = HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC or not 1 <= self.min_len <= self.max_len:
+                raise ValueError(f"잘못된 점수표 파일: {path}")
+            self._offsets = _block_offsets(self.min_len, self.max_len)
+            expected = max(off + 10 ** own for (_, own, _), off in self._offsets.items())
+            if len(self._mm) != expected:
+                raise ValueError(f"잘못된 점수표 파일: {path}")
+        except Exception:
+            self._mm.close()
+            raise
+
+    def lookup(self, digits1: Sequence[int], digits2: Sequence[int]) -> Optional[int]:
+        """두 이름의 획수 1의 자리 행 → 최종 점수(0~99)."""
+        n1, n2 = len(digits1), len(digits2)
+        if not (self.min_len <= n1 <= self.max_len and self.min_len <= n2 <= self.max_len):
+            return None
+        i1 = i2 = 0
+        for d in digits1:
+            i1 = i1 * 10 + d
+        for d in digits2:
+            i2 = i2 * 10 + d
+        a = self._mm[self._offsets[(0, n1, n2)] + i1]
+        b = self._mm[self._offsets[(1, n2, n1)] + i2]
+        return ((a // 10 + b // 10) % 10) * 10 + (a + b) % 10
+
+    def close(self):
+        self._mm.close()
+
+def load_table(path: str = TABLE_PATH) -> Optional[ScoreTable]:
+    """점수표가 없거나 깨졌으면 None (호출부는 축약 루프로 계산)."""
+    try:
+        return ScoreTable(path)
+    except (OSError, ValueError, struct.error):
+        return None
+
+@lru_cache(maxsize=1)
+def default_table() -> Optional[ScoreTable]:
+    return load_table(TABLE_PATH)
+
+def score_rows(digits1: Sequence[int], digits2: Sequence[int],
+               table: Optional[ScoreTable] = None) -> Optional[int]:
+    """두 획수 1의 자리 행의 최종 점수(0~99). 표 범위 밖이면 축약 루프로 계산,
+    합쳐서 2칸 미만이면 None."""
+    table = table or default_table()
+    if table is not None:
+        hit = table.lookup(digits1, digits2)
+        if hit is not None:
+            return hit
+    row = interleave_rows([digits1, digits2])
+    if len(row) < 2:
+        return None
+    return _encode(expand_reduction_steps(row)[-1])
+
+def pair_score(name1: str, name2: str, table: Optional[ScoreTable] = None) -> Optional[int]:
+    """두 이름의 최종 점수(0~99). 한글 음절이 합쳐서 2개 미만이면 None."""
+    return score_rows([s % 10 for s in name_to_strokes(name1)],
+                      [s % 10 for s in name_to_strokes(name2)], table)
+
+def main(argv: Optional[List[str]] = None):
+    ap = argparse.ArgumentParser(description="짧은 이름용 점수표 생성")
+    ap.add_argument("-o", "--out", default=TABLE_PATH, help="출력 경로")
+    ap.add_argument("--min-len", type=int, default=2, help="이름당 최소 음절 수")
+    ap.add_argument("--max-len", type=int, default=4, help="이름당 최대 음절 수")
+    args = ap.parse_args(argv)
+    if not 1 <= args.min_len <= args.max_len <= 255:
+        ap.error(f"음절 수 범위가 잘못되었습니다: {args.min_len}~{args.max_len} (1 <= min <= max <= 255)")
+    path = build_table(args.out, args.min_len, args.max_len)
+    print(f"{path} ({os.path.getsize(path)} bytes)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+import csv, io, os, random, tempfile, zipfile
+import xml.etree.ElementTree as ET
+
+from name_export import export_cards
+
+SYLS = [chr(c) for c in range(0xAC00, 0xAC00 + 300)]
+
+def _pairs(n: int):
+    rng = random.Random(27)
+    return [("".join(rng.choices(SYLS, k=3)), "".join(rng.choices(SYLS, k=3))) for _ in range(n)] + [("abc", "x")]
+
+def test_export_dir_dedups_and_parses():
+    pairs = _pairs(300)
+    with tempfile.TemporaryDirectory() as d:
+        n_pairs, n_files = export_cards(pairs, d, workers=1)
+        svgs = [f for f in os.listdir(d) if f.endswith(".svg")]
+        assert n_pairs == len(pairs) and n_files == len(svgs) <= 100
+        for f in svgs:
+            assert ET.parse(os.path.join(d, f)).getroot().tag.endswith("svg")
+        with open(os.path.join(d, "manifest.csv"), encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == len(pairs)
+        assert rows[-1]["card"] == "" and all(r["card"] in svgs for r in rows[:-1])
+
+def test_export_zip_with_viz_parses():
+    with tempfile.TemporaryDirectory() as d:
+        out = os.path.join(d, "cards.zip")
+        export_cards(_pairs(20), out, viz=True, workers=1)
+        with zipfile.ZipFile(out) as z:
+            names = z.namelist()
+            assert any(n.startswith("viz-") for n in names)
+            for n in names:
+                if n.endswith(".svg"):
+                    ET.parse(io.BytesIO(z.read(n)))
+
+def test_export_rejects_bad_output_before_writing():
+    with tempfile.TemporaryDirectory() as d:
+        target = os.path.join(d, "pairs.csv")
+        with open(target, "w") as f:
+            f.write("keep")
+        for out, fmt in ((target, None), ("-", "dir"), (d, "zip")):
+            try:
+                export_cards([], out, fmt=fmt)
+            except ValueError:
+                continue
+            raise AssertionError((out, fmt))
+        assert open(target).read() == "keep"
+
+if __name__ == "__main__":
+    test_export_dir_dedups_and_parses()
+    test_export_zip_with_viz_parses()
+    test_export_rejects_bad_output_before_writing()
+    print("ok")
@@ -0,0 +1,44 @@
+from __future__ import annotations
+import random
+from itertools import permutations
+
+from name_core import expand_reduction_steps, hangul_syllables, interleave_names, interleave_rows, name_to_strokes
+from name_group import pair_scores, rank_group
+
+SYLS = [chr(c) for c in range(0xAC00, 0xAC00 + 60)]
+
+def _brute_score(order) -> int:
+    full = "".join(interleave_rows([hangul_syllables(n) for n in order]))
+    last = expand_reduction_steps([s % 10 for s in name_to_strokes(full)])[-1]
+    return last[0] * 10 + last[1]
+
+def test_rank_group_matches_brute_force():
+    rng = random.Random(26)
+    for _ in range(30):
+        names = ["".join(rng.choices(SYLS, k=rng.randint(1, 4))) for _ in range(rng.randint(3, 6))]
+        if rng.random() < 0.4:
+            names[1] = names[0]
+        expected = {order: _brute_score(order) for order in set(permutations(names))}
+        got = rank_group(names)
+        assert len(got) == len(expected)
+        assert all(expected[order] == score for score, order in got)
+        assert [s for s, _ in got] == sorted(expected.values(), reverse=True)
+        for top in (1, 3, 7):
+            assert rank_group(names, top=top) == got[:top]
+
+def test_rank_group_keeps_distinct_names_with_equal_strokes():
+    orders = [order for _, order in rank_group(["가나", "나가", "다라"])]
+    assert len(orders) == 6
+    assert any(order[0] == "나가" for order in orders)
+
+def test_pair_scores_match_interleave_names():
+    names = ["김철수", "이영희", "박민준", "최서연"]
+    for score, a, b in pair_scores(names):
+        last = expand_reduction_steps([s % 10 for s in name_to_strokes(interleave_names(a, b))])[-1]
+        assert score == last[0] * 10 + last[1]
+
+if __name__ == "__main__":
+    test_rank_group_matches_brute_force()
+    test_rank_group_keeps_distinct_names_with_equal_strokes()
+    test_pair_scores_match_interleave_names()
+    print("ok")
@@ -0,0 +1,42 @@
+from __future__ import annotations
+import os, random, tempfile
+
+from name_core import expand_reduction_steps, interleave_names, name_to_strokes
+from name_table import build_table, load_table, pair_score
+
+SYLS = [chr(c) for c in range(0xAC00, 0xD7A4)]
+
+def test_table_matches_reduction_loop():
+    rng = random.Random(28)
+    with tempfile.TemporaryDirectory() as d:
+        table = load_table(build_table(os.path.join(d, "t.bin")))
+        assert table is not None
+        for _ in range(3000):
+            a = "".join(rng.choices(SYLS, k=rng.randint(1, 6)))
+            b = "".join(rng.choices(SYLS, k=rng.randint(1, 6)))
+            last = expand_reduction_steps([s % 10 for s in name_to_strokes(interleave_names(a, b))])[-1]
+            assert pair_score(a, b, table) == last[0] * 10 + last[1]
+        table.close()
+
+def test_broken_table_loads_as_none():
+    with tempfile.TemporaryDirectory() as d:
+        good = open(build_table(os.path.join(d, "t.bin")), "rb").read()
+        bad = os.path.join(d, "bad.bin")
+        for data in (b"", b"ND", b"NDT1\x02", b"XXXX" + good[4:], good[:-1]):
+            with open(bad, "wb") as f:
+                f.write(data)
+            assert load_table(bad) is None
+
+def test_build_table_rejects_bad_bounds():
+    for lo, hi in ((0, 2), (3, 2), (1, 256)):
+        try:
+            build_table(os.devnull, lo, hi)
+        except ValueError:
+            continue
+        raise AssertionError((lo, hi))
+
+if __name__ == "__main__":
+    test_table_matches_reduction_loop()
+    test_broken_table_loads_as_none()
+    test_build_table_rejects_bad_bounds()
+    print("ok")